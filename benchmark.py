@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# Benchmarks for the stages of timesheet generation.
+#
+# Every stage runs on fixed seeds so runs are comparable across commits. Results
+# are written as json; pass a previous result file with --compare to flag
+# regressions.
+#
+#   python3 benchmark.py -o bench.json
+#   python3 benchmark.py --compare bench.json
+
+import argparse
+import datetime
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+import timesheet
+
+###
+### PARAMETER GRID
+###
+
+# sampling grid: contract hours, days of week, max hours per day, (start, end) window
+grid_hours = [10, 40, 80]
+grid_days_of_week = [[0, 1, 2, 3, 4], [1, 3], [0, 1, 2, 3, 4, 5, 6]]
+grid_max_hours = [4, 8]
+grid_windows = [(8, 20), (10, 16)]
+grid_allocations = ['chunks', 'days']
+
+# month used for all stages, a complete month with holidays in NI
+bench_year, bench_month = 2025, 5
+
+###
+### HELPER FUNCTIONS
+###
+
+def measure(fn, repeat, number=1):
+    '''Run fn number times per repeat, returns timing statistics per call in ms.'''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number * 1000)
+    return {'min_ms': min(times), 'median_ms': statistics.median(times), 'max_ms': max(times),
+            'repeat': repeat, 'number': number}
+
+def config_for(hours, days_of_week, max_hours, window, **kwargs):
+    start, end = window
+    return timesheet.TimesheetConfig(year=bench_year, month=bench_month, ldom=31, hours=hours,
+            days_of_week=days_of_week, max_hours=max_hours, work_start=start, work_end=end, **kwargs)
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                universal_newlines=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+###
+### STAGES
+###
+
+def bench_sampling(repeat, number):
+    '''The sampling loop over the parameter grid, infeasible combinations are skipped.'''
+    results = {}
+    # build the calendar index outside of the measurements
+    timesheet.calendar_index(timesheet.default_state, bench_year)
+    for allocation, hours, dow, max_hours, window in itertools.product(grid_allocations, grid_hours,
+            grid_days_of_week, grid_max_hours, grid_windows):
+        config = config_for(hours, dow, max_hours, window, allocation=allocation)
+        name = "{} hrs={} dow={} max={} window={}-{}".format(allocation, hours, "".join(map(str, dow)), max_hours, *window)
+        try:
+            timesheet.sample_schedule(config, random.Random(0))
+        except RuntimeError:
+            results[name] = None
+            continue
+        # the same seed every call, so the measured work is identical to the feasibility check above
+        results[name] = measure(lambda: timesheet.sample_schedule(config, random.Random(0)), repeat, number)
+    return results
+
+def bench_formatting(repeat, number):
+    '''The per day formatting loop building the rows.'''
+    config = config_for(40, [0, 1, 2, 3, 4], 6, (8, 20))
+    schedule = timesheet.sample_schedule(config, random.Random(0))
+    return {'format_rows': measure(lambda: timesheet.format_rows(config, schedule), repeat, number)}
+
+def bench_tex(repeat, number):
+    '''Emission of the latex source for one and for twelve months.'''
+    config = config_for(40, [0, 1, 2, 3, 4], 6, (8, 20), seed=0)
+    one = [timesheet.generate(config)]
+    year, _ = timesheet.generate_months(config, list(range(1, 13)))
+    timesheet.load_template(config.template)
+    return {
+        'write_tex 1 month': measure(lambda: timesheet.write_tex(io.StringIO(), one), repeat, number),
+        'write_tex 12 months': measure(lambda: timesheet.write_tex(io.StringIO(), year), repeat, number),
+    }
+
+def bench_render(repeat):
+    '''End to end generation including rendering, latex only if pdflatex is installed.'''
+    results = {}
+    backends = ['native'] + (['latex'] if shutil.which('pdflatex') else [])
+    for backend in backends:
+        config = config_for(40, [0, 1, 2, 3, 4], 6, (8, 20), backend=backend)
+        # warm up caches (format, logo, holidays) so only the steady state is measured
+        timesheet.generate(config, render_pdf=True)
+        results[backend] = measure(lambda: timesheet.generate(config, render_pdf=True), repeat)
+    return results
+
+###
+### COMPARISON
+###
+
+def flatten(report):
+    '''{"stage/case": median_ms} of a report.'''
+    flat = {}
+    for stage, cases in report['stages'].items():
+        for case, stats in cases.items():
+            if stats is not None:
+                flat["{}/{}".format(stage, case)] = stats['median_ms']
+    return flat
+
+def compare(old, new, threshold):
+    '''Print the change of every case against an old report, returns the regressed cases.'''
+    old_flat, new_flat = flatten(old), flatten(new)
+    regressions = []
+    print("{:60s} {:>10s} {:>10s} {:>8s}".format("case", "old ms", "new ms", "change"))
+    for case in sorted(new_flat):
+        if case not in old_flat:
+            continue
+        ratio = new_flat[case] / old_flat[case] if old_flat[case] else float('inf')
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(case)
+            flag = "  REGRESSION"
+        print("{:60s} {:10.3f} {:10.3f} {:+7.1f}%{}".format(case, old_flat[case], new_flat[case], (ratio - 1) * 100, flag))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark timesheet generation stages.', formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+    parser.add_argument('-o', help='write the results to this json file', default=None)
+    parser.add_argument('--compare', help='json file of an earlier run to compare against', default=None)
+    parser.add_argument('--threshold', help='relative slowdown of the median that counts as regression', type=float, default=0.2)
+    parser.add_argument('--repeat', help='repetitions per case', type=int, default=7)
+    parser.add_argument('--number', help='calls per repetition for the fast stages', type=int, default=20)
+    parser.add_argument('--stages', help='stages to run', nargs='*', default=['sampling', 'formatting', 'tex', 'render'])
+    args = parser.parse_args()
+
+    # keep the pdf cache out of the measurements
+    timesheet.pdf_cache_size = 0
+
+    stages = {
+        'sampling': lambda: bench_sampling(args.repeat, args.number),
+        'formatting': lambda: bench_formatting(args.repeat, args.number),
+        'tex': lambda: bench_tex(args.repeat, args.number),
+        'render': lambda: bench_render(args.repeat),
+    }
+    report = {
+        'revision': git_revision(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'stages': {},
+    }
+    for stage in args.stages:
+        report['stages'][stage] = stages[stage]()
+        for case, stats in report['stages'][stage].items():
+            median = "infeasible" if stats is None else "{:.3f} ms".format(stats['median_ms'])
+            print("{:12s} {:50s} {}".format(stage, case, median), file=sys.stderr)
+
+    if args.o:
+        with open(args.o, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        if compare(old, report, args.threshold):
+            raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
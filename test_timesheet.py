@@ -0,0 +1,145 @@
+# Tests of the sampling core, run with python3 -m pytest
+
+import calendar
+import dataclasses
+import datetime
+import random
+
+import pytest
+
+import timesheet
+
+
+class FixedRandom:
+    '''Stand-in for random.Random returning the given values from random().'''
+
+    def __init__(self, values):
+        self.values = iter(values)
+
+    def random(self):
+        return next(self.values)
+
+def linear_choice(weights, u):
+    '''Index drawn by a linear scan over the cumulative weights for the uniform value u.'''
+    r = u * sum(weights)
+    for i, w in enumerate(weights):
+        if w and r < w:
+            return i
+        r -= w
+    return max(i for i, w in enumerate(weights) if w)
+
+def random_config(rng, **kwargs):
+    '''A random, not necessarily feasible, configuration.'''
+    start = rng.randint(6, 12)
+    options = dict(year=rng.randint(2024, 2027), month=rng.randint(1, 12), ldom=31,
+            hours=rng.randint(5, 100), max_hours=rng.randint(1, 8), work_start=start,
+            work_end=rng.randint(start + 2, 22), days_of_week=rng.sample(range(7), rng.randint(1, 7)),
+            granularity=rng.choice([15, 30, 60]))
+    options.update(kwargs)
+    return timesheet.TimesheetConfig(**options)
+
+def random_blocked(rng, config):
+    '''Up to 30 random recurring and one-off blocked intervals around the window of config.'''
+    blocked = []
+    for _ in range(rng.randint(0, 30)):
+        start = rng.randrange(config.work_start * 60 - 60, config.work_end * 60, 5)
+        when = rng.randrange(7) if rng.random() < 0.7 else datetime.date(config.year, config.month, rng.randint(1, 28)).isoformat()
+        blocked.append([when, start, start + rng.choice([5, 30, 60, 90, 120, 600])])
+    if rng.random() < 0.1:
+        blocked.append([rng.randrange(7), 0, 24 * 60])
+    return blocked
+
+def check_schedule(config, schedule, minutes=None):
+    '''Assert exact totals, the window, -max, the chunk grid and that no block overlaps a blocked time.'''
+    assert sum(end - start for start, end in schedule.values()) == (config.hours * 60 if minutes is None else minutes)
+    for day, (start, end) in schedule.items():
+        date = datetime.date(config.year, config.month, day)
+        assert date.weekday() in config.days_of_week
+        assert config.work_start * 60 <= start < end <= config.work_end * 60
+        assert end - start <= config.max_hours * 60
+        assert (start - config.work_start * 60) % config.granularity == 0
+        for when, blocked_start, blocked_end in config.blocked:
+            if when in (date.weekday(), date.isoformat()):
+                assert end <= blocked_start or start >= blocked_end
+
+def test_weighted_sampler_matches_linear_scan():
+    rng = random.Random(1)
+    for _ in range(200):
+        n = rng.randint(1, 40)
+        weights = [rng.random() for _ in range(n)]
+        draws = [rng.random() for _ in range(n)]
+        sampler = timesheet.WeightedSampler(range(n), weights, FixedRandom(draws))
+        remaining = list(weights)
+        for u in draws:
+            assert sampler.choice() == linear_choice(remaining, u)
+            # remove a random option that is still available
+            index = rng.choice([i for i, w in enumerate(remaining) if w])
+            sampler.remove(index)
+            remaining[index] = 0.0
+            assert len(sampler) == sum(1 for w in remaining if w)
+            assert sampler.total() == pytest.approx(sum(remaining))
+
+def test_weighted_sampler_distribution():
+    weights = [1 / i for i in range(1, 7)]
+    sampler = timesheet.WeightedSampler(range(6), weights, random.Random(0))
+    sampler.remove(0)
+    sampler.remove(3)
+    n = 50000
+    counts = [0] * 6
+    for _ in range(n):
+        counts[sampler.choice()] += 1
+    total = sum(w for i, w in enumerate(weights) if i not in (0, 3))
+    for i, w in enumerate(weights):
+        expected = 0 if i in (0, 3) else w / total
+        assert counts[i] / n == pytest.approx(expected, abs=0.01)
+
+def test_valid_days_matches_date_loop():
+    rng = random.Random(2)
+    for _ in range(1000):
+        config = timesheet.TimesheetConfig(state=rng.choice(['NI', 'BY', 'BE', 'SN']), year=rng.randint(2020, 2030),
+                month=rng.randint(1, 12), ldom=rng.randint(-2, 33), days_of_week=rng.sample(range(8), rng.randint(0, 8)))
+        public_holidays = timesheet.holiday_index(config.state, config.year)
+        days_in_month = calendar.monthrange(config.year, config.month)[1]
+        expected = [day for day in range(1, min(days_in_month, config.ldom) + 1)
+                if datetime.date(config.year, config.month, day) not in public_holidays
+                and datetime.date(config.year, config.month, day).weekday() in config.days_of_week]
+        assert timesheet.valid_days(config) == expected
+
+@pytest.mark.parametrize('allocation', ['chunks', 'days'])
+def test_blocked_times_are_never_overlapped(allocation):
+    rng = random.Random(3)
+    feasible = 0
+    for i in range(600):
+        config = random_config(rng, allocation=allocation)
+        config = dataclasses.replace(config, blocked=random_blocked(rng, config))
+        try:
+            schedule = timesheet.sample_schedule(config, random.Random(i))
+        except RuntimeError as e:
+            # only the analytic check may refuse, the sampler itself must never run dry
+            assert 'requested' in str(e)
+            continue
+        feasible += 1
+        check_schedule(config, schedule)
+    assert feasible > 100
+
+@pytest.mark.parametrize('allocation', ['chunks', 'days'])
+@pytest.mark.parametrize('blocked', [[], [[1, 600, 720], [3, 480, 570], ['2025-05-21', 0, 1440]]])
+def test_incremental_keeps_days_and_completes_month(tmp_path, allocation, blocked):
+    previous = {}
+    for ldom in range(1, 32):
+        config = timesheet.TimesheetConfig(year=2025, month=5, ldom=ldom, hours=40, max_hours=4,
+                allocation=allocation, blocked=blocked, incremental=str(tmp_path))
+        schedule = timesheet.generate(config).schedule
+        for day, block in previous.items():
+            assert schedule[day] == block
+        assert all(day <= ldom for day in schedule)
+        previous = dict(schedule)
+    check_schedule(config, schedule)
+
+def test_read_blocked(tmp_path):
+    path = tmp_path / 'blocked.txt'
+    path.write_text("# lectures\nTue 10:00-12:00\nthursday 08:00–09:30\n2026-10-21 all day\n")
+    assert timesheet.read_blocked(str(path)) == [[1, 600, 720], [3, 480, 570], ['2026-10-21', 0, 1440]]
+    path.write_text("Foo 10:00-12:00\n")
+    with pytest.raises(ValueError, match='blocked.txt:1'):
+        timesheet.read_blocked(str(path))